@@ -1,57 +1,131 @@
+import os
 import secrets
-import hmac
 import hashlib
 import sys
-from typing import List, Tuple, Dict
-from prettytable import PrettyTable
-from colorama import init, Fore, Style
+from typing import List, Tuple, Dict, Union
+import numpy as np
 
-# Initialize colorama for cross-platform colored output
-init()
+class _NoColor:
+    """Stand-in for colorama's Fore/Style when colored output is disabled."""
+    RESET_ALL = BLACK = RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = ''
+
+# Rebound to the real colorama objects by _init_colors() when appropriate
+Fore = Style = _NoColor
+
+def _init_colors():
+    """Import and initialize colorama only for interactive color-capable output."""
+    global Fore, Style
+    if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+        return
+    try:
+        import colorama
+    except ImportError:
+        return
+    if sys.platform == 'win32':
+        # Only Windows needs the stdout wrapper that translates ANSI codes;
+        # POSIX terminals handle them natively, so skip the per-write hook
+        colorama.init()
+    Fore, Style = colorama.Fore, colorama.Style
+
+class _EntropyPool:
+    """
+    Batches OS entropy reads so each draw doesn't pay a separate
+    getrandom() syscall. Refilled from os.urandom when exhausted.
+    """
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._buf = os.urandom(size)
+        self._off = 0
+
+    def take(self, n: int) -> bytes:
+        if self._off + n > self._size:
+            self._buf = os.urandom(self._size)
+            self._off = 0
+        chunk = self._buf[self._off:self._off + n]
+        self._off += n
+        return chunk
+
+_pool = _EntropyPool()
+
+# Committed values are tiny (die faces, 0/1 flips); precompute their byte
+# encodings so commitments skip str()/encode() per call
+_VALUE_BYTES = tuple(str(i).encode() for i in range(256))
 
 class CommitmentScheme:
     @staticmethod
-    def create_commitment(value: int, nonce: bytes = None) -> Tuple[bytes, bytes, str]:
+    def create_commitment(value: int, nonce: bytes = None) -> Tuple[bytes, bytes, bytes]:
         """
         Creates a commitment to a value using a nonce.
         Returns (nonce, key, commitment_hash)
         """
         if nonce is None:
-            nonce = secrets.token_bytes(32)
-        key = secrets.token_bytes(32)
-        
-        # Combine value, nonce and key to create commitment
-        message = str(value).encode() + nonce + key
-        commitment = hashlib.sha3_256(message).hexdigest()
+            # One 64-byte draw split in two instead of separate 32-byte draws
+            nk = _pool.take(64)
+            nonce, key = nk[:32], nk[32:]
+        else:
+            key = _pool.take(32)
         
+        # Combine value, nonce and key to create commitment; incremental
+        # updates avoid concatenating a temporary message buffer
+        h = hashlib.sha256()
+        h.update(_VALUE_BYTES[value] if 0 <= value < 256 else str(value).encode())
+        h.update(nonce)
+        h.update(key)
+        # Raw digest; callers hex-encode only for display
+        commitment = h.digest()
+
         return nonce, key, commitment
     
     @staticmethod
-    def verify_commitment(value: int, nonce: bytes, key: bytes, commitment: str) -> bool:
+    def verify_commitment(value: int, nonce: bytes, key: bytes, commitment: bytes) -> bool:
         """Verifies that a revealed value matches its commitment"""
-        message = str(value).encode() + nonce + key
-        expected_commitment = hashlib.sha3_256(message).hexdigest()
-        return hmac.compare_digest(commitment, expected_commitment)
+        h = hashlib.sha256()
+        h.update(_VALUE_BYTES[value] if 0 <= value < 256 else str(value).encode())
+        h.update(nonce)
+        h.update(key)
+        expected_commitment = h.digest()
+        # Plain equality is fine here: both digests are public once the
+        # value is revealed, so there is no secret for timing to leak
+        return commitment == expected_commitment
 
 class Dice:
-    def __init__(self, values: List[int]):
-        if len(values) != 6:
+    def __init__(self, values: Union[List[int], np.ndarray]):
+        arr = np.asarray(values)
+        if arr.shape != (6,):
             raise ValueError("Each die must have exactly 6 values")
-        if not all(isinstance(x, int) for x in values):
+        if not np.issubdtype(arr.dtype, np.integer):
             raise ValueError("All dice values must be integers")
-        self.values = values
+        self.values = arr.tolist()
+        # Keep the natural integer dtype: casting down to int8 would
+        # silently wrap face values outside [-128, 127]
+        self.arr = arr
+        self._str = ','.join(map(str, self.values))
 
     def __str__(self):
-        return ','.join(map(str, self.values))
+        return self._str
 
 class FairRandomGenerator:
     @staticmethod
-    def generate_random_value(range_start: int, range_end: int) -> Tuple[int, bytes, bytes, str]:
+    def _randbelow(n: int) -> int:
+        """Uniform value in [0, n) via byte-wise rejection sampling on the pool."""
+        if n & (n - 1) == 0:
+            # Power-of-two range (e.g. the 0/1 first-player flip): a bit
+            # mask is uniform without rejection
+            return _pool.take(1)[0] & (n - 1)
+        # For a d6 the rejection limit is 252, so a retry is rare (~1.6%)
+        limit = 256 - 256 % n
+        while True:
+            b = _pool.take(1)[0]
+            if b < limit:
+                return b % n
+
+    @staticmethod
+    def generate_random_value(range_start: int, range_end: int) -> Tuple[int, bytes, bytes, bytes]:
         """
         Generate a random number with commitment scheme.
         Returns (number, nonce, key, commitment)
         """
-        number = secrets.randbelow(range_end - range_start + 1) + range_start
+        number = FairRandomGenerator._randbelow(range_end - range_start + 1) + range_start
         nonce, key, commitment = CommitmentScheme.create_commitment(number)
         return number, nonce, key, commitment
 
@@ -61,10 +135,28 @@ class Game:
             raise ValueError("At least 3 dice configurations are required")
         self.dice_list = dice_list
         self.used_dice_index = None
+        self._indices = tuple(range(len(dice_list)))
+        # Pre-render the dice menu for every possible excluded die so each
+        # turn emits one buffered write instead of a print per option
+        self._option_strs = {
+            exclude: "".join(
+                f"{i + 1} - {dice_list[i]}\n" for i in self._indices if i != exclude
+            ) + "? - help\nx - exit\n"
+            for exclude in (None,) + self._indices
+        }
+        # Dice are immutable after parsing, so the win-probability table
+        # can be computed once and reused for every help request. One
+        # broadcast compare over all (N, N, 6, 6) pairings replaces the
+        # per-pair Python loop.
+        self._A = np.stack([d.arr for d in dice_list])
+        self._prob_table = (self._A[:, None, :, None] > self._A[None, :, None, :]).mean(axis=(2, 3))
+        self._help_text = None
 
     def display_title(self):
-        print(f"\n{Fore.CYAN}=== Provably Fair Non-Transitive Dice Game ==={Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Each move uses a commitment scheme to ensure fairness!{Style.RESET_ALL}\n")
+        sys.stdout.write(
+            f"\n{Fore.CYAN}=== Provably Fair Non-Transitive Dice Game ==={Style.RESET_ALL}\n"
+            f"{Fore.YELLOW}Each move uses a commitment scheme to ensure fairness!{Style.RESET_ALL}\n\n"
+        )
 
     def play(self):
         self.display_title()
@@ -72,7 +164,7 @@ class Game:
         
         # First, create and show commitment
         first_player, nonce, key, commitment = FairRandomGenerator.generate_random_value(0, 1)
-        print(f"I've committed to my choice. Commitment: {commitment}")
+        print(f"I've committed to my choice. Commitment: {commitment.hex()}")
         
         # Get user's guess
         user_guess = self.get_user_guess()
@@ -97,12 +189,14 @@ class Game:
         self.determine_winner(user_roll, computer_roll)
 
     def get_user_guess(self) -> int:
-        print("\nTry to guess my selection:")
-        print("0 - You think I selected 0")
-        print("1 - You think I selected 1")
-        print("? - help")
-        print("x - exit")
-        
+        sys.stdout.write(
+            "\nTry to guess my selection:\n"
+            "0 - You think I selected 0\n"
+            "1 - You think I selected 1\n"
+            "? - help\n"
+            "x - exit\n"
+        )
+
         while True:
             user_input = input(f"{Fore.YELLOW}Your guess: {Style.RESET_ALL}").strip().lower()
             if user_input == "0":
@@ -127,7 +221,7 @@ class Game:
         
         # First create and show commitment
         roll, nonce, key, commitment = FairRandomGenerator.generate_random_value(0, 5)
-        print(f"\nI've committed to the roll. Commitment: {commitment}")
+        print(f"\nI've committed to the roll. Commitment: {commitment.hex()}")
         
         # Get user acknowledgment
         input(f"{Fore.YELLOW}Press Enter to see the roll...{Style.RESET_ALL}")
@@ -147,7 +241,10 @@ class Game:
 
     def computer_turn(self, exclude: int = None) -> int:
         print("\nIt's time for my throw.")
-        available_indices = [i for i in range(len(self.dice_list)) if i != exclude]
+        if exclude is None:
+            available_indices = self._indices
+        else:
+            available_indices = self._indices[:exclude] + self._indices[exclude + 1:]
         computer_choice = secrets.choice(available_indices)
         self.used_dice_index = computer_choice
         selected_dice = self.dice_list[computer_choice]
@@ -156,7 +253,7 @@ class Game:
         
         # First create and show commitment
         roll, nonce, key, commitment = FairRandomGenerator.generate_random_value(0, 5)
-        print(f"I've committed to the roll. Commitment: {commitment}")
+        print(f"I've committed to the roll. Commitment: {commitment.hex()}")
         
         # Get user acknowledgment
         input(f"{Fore.YELLOW}Press Enter to see my roll...{Style.RESET_ALL}")
@@ -175,12 +272,7 @@ class Game:
         return selected_value
 
     def display_dice_options(self, exclude: int = None):
-        for i, dice in enumerate(self.dice_list):
-            if exclude is not None and i == exclude:
-                continue
-            print(f"{i + 1} - {dice}")
-        print("? - help")
-        print("x - exit")
+        sys.stdout.write(self._option_strs[exclude])
 
     def get_user_dice_choice(self, exclude: int = None) -> int:
         while True:
@@ -213,31 +305,41 @@ class Game:
         else:
             print(f"{Fore.YELLOW}It's a tie ({user_roll} = {computer_roll})!{Style.RESET_ALL}")
 
-    def display_help_table(self):
-        table = PrettyTable()
-        table.field_names = [f"{Fore.CYAN}User Dice v{Style.RESET_ALL}"] + [
-            f"{Fore.YELLOW}Dice {i+1}{Style.RESET_ALL}" for i in range(len(self.dice_list))
+    def _render_help_table(self) -> str:
+        """Render the probability table once; dice never change after parsing."""
+        n = len(self.dice_list)
+        labels = [str(d) for d in self.dice_list]
+        header = ["User Dice v"] + [f"Dice {i + 1}" for i in range(n)]
+        # Pad cells to a common width before wrapping them in color codes so
+        # the ANSI escapes don't throw off the alignment
+        width = max(len(s) for s in labels + header + ["- (0.3333)"])
+        sep = "+" + "+".join("-" * (width + 2) for _ in range(n + 1)) + "+"
+
+        colored_header = [f"{Fore.CYAN}{header[0]:>{width}}{Style.RESET_ALL}"] + [
+            f"{Fore.YELLOW}{cell:>{width}}{Style.RESET_ALL}" for cell in header[1:]
         ]
-        
-        for i, user_dice in enumerate(self.dice_list):
-            row = [f"{Fore.GREEN}{user_dice}{Style.RESET_ALL}"]
-            for opponent_dice in self.dice_list:
-                if user_dice == opponent_dice:
-                    prob = "- (0.3333)"
-                else:
-                    prob = f"{self.calculate_win_probability(user_dice, opponent_dice):.4f}"
-                row.append(prob)
-            table.add_row(row)
-        
+        lines = [sep, "| " + " | ".join(colored_header) + " |", sep]
+        for i, label in enumerate(labels):
+            row = [f"{Fore.GREEN}{label:>{width}}{Style.RESET_ALL}"]
+            for j in range(n):
+                cell = "- (0.3333)" if i == j else f"{self._prob_table[i, j]:.4f}"
+                row.append(f"{cell:>{width}}")
+            lines.append("| " + " | ".join(row) + " |")
+        lines.append(sep)
+        return "\n".join(lines)
+
+    def display_help_table(self):
+        if self._help_text is None:
+            self._help_text = self._render_help_table()
         print("\nWinning Probabilities Table:")
-        print(table)
+        print(self._help_text)
         print("\nNote: Probabilities show the chance of the row dice winning against the column dice")
 
     @staticmethod
     def calculate_win_probability(dice1: Dice, dice2: Dice) -> float:
-        wins = sum(1 for v1 in dice1.values for v2 in dice2.values if v1 > v2)
-        total = len(dice1.values) * len(dice2.values)
-        return wins / total
+        # Broadcast compare: one vectorized 6x6 comparison instead of a
+        # Python-level double loop
+        return float((dice1.arr[:, None] > dice2.arr[None, :]).mean())
 
 def parse_dice_configurations(args: List[str]) -> List[Dice]:
     """Parse command line arguments into dice configurations"""
@@ -247,13 +349,15 @@ def parse_dice_configurations(args: List[str]) -> List[Dice]:
     dice_list = []
     for arg in args:
         try:
-            values = [int(x) for x in arg.split(",")]
+            # Parse the whole argument in C instead of one int() per value
+            values = np.array(arg.split(","), dtype=np.int64)
             dice_list.append(Dice(values))
-        except (ValueError, TypeError) as e:
+        except (ValueError, TypeError, OverflowError) as e:
             raise ValueError(f"Invalid dice configuration '{arg}': {e}")
     return dice_list
 
 def main():
+    _init_colors()
     if len(sys.argv) < 4:
         print(f"{Fore.RED}Error: You must provide at least 3 dice configurations.{Style.RESET_ALL}")
         print("Example usage: python game.py 2,2,4,4,9,9 6,8,1,1,8,6 7,5,3,7,5,3")
@@ -263,12 +367,15 @@ def main():
         dice_list = parse_dice_configurations(sys.argv[1:])
         game = Game(dice_list)
         
+        menu = (
+            f"\n{Fore.CYAN}Main Menu:{Style.RESET_ALL}\n"
+            "1 - Start Game\n"
+            "2 - Help\n"
+            "x - Exit\n"
+        )
         while True:
-            print(f"\n{Fore.CYAN}Main Menu:{Style.RESET_ALL}")
-            print("1 - Start Game")
-            print("2 - Help")
-            print("x - Exit")
-            
+            sys.stdout.write(menu)
+
             user_input = input(f"{Fore.YELLOW}Your selection: {Style.RESET_ALL}").strip().lower()
             if user_input == "1":
                 game.play()